@@ -7,9 +7,35 @@ Secure user management system for Maharashtra Agricultural System
 from mongodb_config import MongoCropDB
 import bcrypt
 import secrets
+import time
 from datetime import datetime, timedelta
 from bson.objectid import ObjectId
 
+# Calibrate the bcrypt cost factor once per process so password hashing
+# lands near the target latency on whatever hardware we run on: too few
+# rounds weakens the hash, too many blocks Streamlit's worker for seconds
+# per registration/login.
+_MIN_BCRYPT_ROUNDS = 12
+_MAX_BCRYPT_ROUNDS = 15
+_TARGET_HASH_SECONDS = 0.25
+_calibrated_rounds = None
+
+
+def _bcrypt_rounds():
+    """Smallest cost factor (>= 12) whose hash takes ~250 ms here."""
+    global _calibrated_rounds
+    if _calibrated_rounds is None:
+        rounds = _MIN_BCRYPT_ROUNDS
+        while rounds < _MAX_BCRYPT_ROUNDS:
+            start = time.perf_counter()
+            bcrypt.hashpw(b'calibration-probe', bcrypt.gensalt(rounds))
+            if time.perf_counter() - start >= _TARGET_HASH_SECONDS:
+                break
+            rounds += 1
+        _calibrated_rounds = rounds
+    return _calibrated_rounds
+
+
 class MongoFarmerAuth:
     def __init__(self):
         """Initialize MongoDB connection and collections"""
@@ -51,8 +77,8 @@ class MongoFarmerAuth:
         self.preferences.create_index('farmer_id', unique=True)
     
     def hash_password(self, password):
-        """Securely hash password with bcrypt"""
-        salt = bcrypt.gensalt()
+        """Securely hash password with bcrypt at the calibrated cost"""
+        salt = bcrypt.gensalt(_bcrypt_rounds())
         password_hash = bcrypt.hashpw(password.encode('utf-8'), salt)
         return password_hash.decode('utf-8'), salt.decode('utf-8')
     